@@ -0,0 +1,40 @@
+import json
+
+from web3 import Web3
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+
+
+def test_geth_admin_start_servers(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 0, "result": true},'
+                     b'{"jsonrpc": "2.0", "id": 1, "result": false}]',
+    )
+    result = web3.geth.admin.start_servers(rpc_kwargs={'port': 8545}, ws_kwargs={'cors': '*'})
+
+    assert result == (True, False)
+    assert make_post_request.call_count == 1
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert [request['method'] for request in requests] == ['admin_startRPC', 'admin_startWS']
+    assert requests[0]['params'] == ['localhost', 8545, '', 'eth,net,web3']
+    assert requests[1]['params'] == ['localhost', 8546, '*', 'eth,net,web3']
+
+
+def test_geth_admin_stop_servers(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 0, "result": true},'
+                     b'{"jsonrpc": "2.0", "id": 1, "result": true}]',
+    )
+
+    assert web3.geth.admin.stop_servers() == (True, True)
+    assert make_post_request.call_count == 1
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert [request['method'] for request in requests] == ['admin_stopRPC', 'admin_stopWS']
+    assert [request['params'] for request in requests] == [[], []]
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import pytest
+
+from web3 import Web3
+from web3._utils.caching import (
+    RequestCoalescer,
+)
+from web3.geth import (
+    AsyncGethTxPool,
+    Geth,
+)
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_call():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def fn():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    results = await asyncio.gather(*(coalescer.call('key', fn) for _ in range(5)))
+    assert results == [1] * 5
+
+    # the key is released once the call completes
+    assert await coalescer.call('key', fn) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_every_caller():
+    coalescer = RequestCoalescer()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    results = await asyncio.gather(
+        coalescer.call('key', fn), coalescer.call('key', fn), return_exceptions=True
+    )
+    assert [str(result) for result in results] == ['boom', 'boom']
+
+
+@pytest.mark.asyncio
+async def test_async_txpool_status_coalesces_concurrent_calls(mocker):
+    requests = []
+
+    async def async_make_post_request(endpoint_uri, data, **kwargs):
+        requests.append(json.loads(data))
+        await asyncio.sleep(0.01)
+        return json.dumps({
+            'jsonrpc': '2.0',
+            'id': requests[-1]['id'],
+            'result': {'pending': '0x0', 'queued': '0x0'},
+        }).encode()
+
+    mocker.patch('web3.providers.async_rpc.async_make_post_request', new=async_make_post_request)
+    w3 = Web3(
+        AsyncHTTPProvider(),
+        middlewares=[],
+        modules={'geth': (Geth, {'txpool': (AsyncGethTxPool,)})},
+    )
+
+    results = await asyncio.gather(*(w3.geth.txpool.status() for _ in range(3)))
+
+    assert [request['method'] for request in requests] == ['txpool_status']
+    assert all(result == {'pending': '0x0', 'queued': '0x0'} for result in results)
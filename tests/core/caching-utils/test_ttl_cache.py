@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+
+from web3._utils.caching import (
+    TTLCache,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('web3._utils.caching.time.monotonic', lambda: now[0])
+    return now
+
+
+def test_get_or_call_reuses_value_until_expired(clock):
+    cache = TTLCache()
+    calls = []
+
+    def fn():
+        calls.append(None)
+        return len(calls)
+
+    assert cache.get_or_call('key', 5, fn) == 1
+    clock[0] += 4
+    assert cache.get_or_call('key', 5, fn) == 1
+    clock[0] += 1
+    assert cache.get_or_call('key', 5, fn) == 2
+
+
+def test_empty_results_are_cached(clock):
+    cache = TTLCache()
+    calls = []
+
+    def fn():
+        calls.append(None)
+        return []
+
+    cache.get_or_call('key', 5, fn)
+    cache.get_or_call('key', 5, fn)
+    assert len(calls) == 1
+
+
+def test_zero_ttl_disables_caching(clock):
+    cache = TTLCache()
+    cache.set('key', 'value', 0)
+    assert cache.get('key') is None
+
+
+def test_invalidate(clock):
+    cache = TTLCache()
+    cache.set('a', 1, 5)
+    cache.set('b', 2, 5)
+    cache.invalidate('a', 'missing')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_call_coalesces_concurrent_misses():
+    cache = TTLCache()
+    calls = []
+
+    async def fn():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return 'value'
+
+    results = await asyncio.gather(*(cache.async_get_or_call('key', 5, fn) for _ in range(5)))
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+
+
+def test_mutating_a_result_does_not_change_the_cache(clock):
+    cache = TTLCache()
+    cache.get_or_call('key', 5, lambda: ['a']).append('b')
+    cache.get('key').append('c')
+    assert cache.get_or_call('key', 5, lambda: ['unused']) == ['a']
+
+
+def test_get_or_call_drops_result_invalidated_during_the_call(clock):
+    cache = TTLCache()
+
+    def fn():
+        cache.invalidate('key')
+        return 'outdated'
+
+    assert cache.get_or_call('key', 5, fn) == 'outdated'
+    assert cache.get('key') is None
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_call_drops_result_invalidated_during_refresh():
+    cache = TTLCache()
+    refreshing = asyncio.Event()
+
+    async def fn():
+        refreshing.set()
+        await asyncio.sleep(0.01)
+        return ['old-account']
+
+    refresh = asyncio.ensure_future(cache.async_get_or_call('key', 5, fn))
+    await refreshing.wait()
+    cache.invalidate('key')
+
+    assert await refresh == ['old-account']
+    assert cache.get('key') is None
+
+
+def test_zero_ttl_get_or_call_does_not_copy(clock):
+    cache = TTLCache()
+    value = ['a']
+    assert cache.get_or_call('key', 0, lambda: value) is value
+    assert cache.get('key') is None
@@ -0,0 +1,88 @@
+import json
+import pytest
+
+from web3 import Web3
+from web3.providers import (
+    BaseProvider,
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+
+
+class SequentialProvider(BaseProvider):
+    def __init__(self, results):
+        self.results = results
+        self.methods = []
+
+    def make_request(self, method, params):
+        self.methods.append(method)
+        return {'jsonrpc': '2.0', 'id': len(self.methods), 'result': self.results[method].pop(0)}
+
+
+@pytest.fixture(autouse=True)
+def always_wait_for_mining_start():
+    # overrides the conftest fixture: these tests mock the transport and need no node
+    pass
+
+
+def test_geth_miner_make_dag_and_wait_for_mining(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        side_effect=[
+            b'[{"jsonrpc": "2.0", "id": 0, "result": true},'
+            b'{"jsonrpc": "2.0", "id": 1, "result": false}]',
+            b'{"jsonrpc": "2.0", "id": 2, "result": false}',
+            b'{"jsonrpc": "2.0", "id": 3, "result": true}',
+        ],
+    )
+
+    assert web3.geth.miner.make_dag_and_wait_for_mining(10, poll_ms=1) == (True, True)
+
+    requests = json.loads(make_post_request.call_args_list[0][0][1])
+    assert [request['method'] for request in requests] == ['miner_makeDag', 'eth_mining']
+    assert make_post_request.call_count == 3
+
+
+def test_geth_miner_make_dag_and_wait_for_mining_times_out(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        side_effect=lambda uri, data, **kwargs: (
+            b'[{"jsonrpc": "2.0", "id": 0, "result": true},'
+            b'{"jsonrpc": "2.0", "id": 1, "result": false}]'
+            if data.startswith(b'[') else
+            b'{"jsonrpc": "2.0", "id": 2, "result": false}'
+        ),
+    )
+
+    assert web3.geth.miner.make_dag_and_wait_for_mining(10, poll_ms=1, timeout=0.05) == (
+        True,
+        False,
+    )
+
+
+def test_geth_miner_make_dag_and_wait_for_mining_when_dag_fails(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=(
+            b'[{"jsonrpc": "2.0", "id": 0, "result": false},'
+            b'{"jsonrpc": "2.0", "id": 1, "result": false}]'
+        ),
+    )
+
+    assert web3.geth.miner.make_dag_and_wait_for_mining(10, poll_ms=1) == (False, False)
+    assert make_post_request.call_count == 1
+
+
+def test_geth_miner_make_dag_and_wait_for_mining_without_batching(mocker):
+    provider = SequentialProvider({'miner_makeDag': [True], 'eth_mining': [False, True]})
+    make_batch_request = mocker.spy(provider, 'make_batch_request')
+    web3 = Web3(provider)
+
+    assert web3.geth.miner.make_dag_and_wait_for_mining(10, poll_ms=1) == (True, True)
+
+    assert provider.methods == ['miner_makeDag', 'eth_mining', 'eth_mining']
+    assert not make_batch_request.called
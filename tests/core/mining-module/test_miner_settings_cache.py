@@ -0,0 +1,45 @@
+import pytest
+
+from web3 import Web3
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+
+
+@pytest.fixture(autouse=True)
+def always_wait_for_mining_start():
+    # overrides the conftest fixture: these tests mock the transport and need no node
+    pass
+
+
+def test_geth_miner_skips_unchanged_settings(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'{"jsonrpc": "2.0", "id": 0, "result": true}',
+    )
+
+    assert web3.geth.miner.set_gas_price(10)
+    assert web3.geth.miner.set_gas_price(10)
+    assert make_post_request.call_count == 1
+
+    assert web3.geth.miner.set_gas_price(20)
+    assert make_post_request.call_count == 2
+
+    web3.geth.miner.invalidate_miner_cache()
+    assert web3.geth.miner.set_gas_price(20)
+    assert make_post_request.call_count == 3
+
+
+def test_geth_miner_retries_rejected_settings(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'{"jsonrpc": "2.0", "id": 0, "result": false}',
+    )
+
+    assert not web3.geth.miner.set_extra('extra')
+    assert not web3.geth.miner.set_extra('extra')
+    assert make_post_request.call_count == 2
@@ -0,0 +1,37 @@
+import json
+import pytest
+
+from web3 import Web3
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+
+
+@pytest.fixture(autouse=True)
+def always_wait_for_mining_start():
+    # overrides the conftest fixture: these tests mock the transport and need no node
+    pass
+
+
+@pytest.mark.parametrize(
+    'auto_dag,auto_dag_method',
+    (
+        (True, 'miner_startAutoDag'),
+        (False, 'miner_stopAutoDag'),
+    ),
+)
+def test_geth_miner_start_mining(mocker, auto_dag, auto_dag_method):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 0, "result": true},'
+                     b'{"jsonrpc": "2.0", "id": 1, "result": true}]',
+    )
+
+    assert web3.geth.miner.start_mining(2, auto_dag=auto_dag) == (True, True)
+    assert make_post_request.call_count == 1
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert [request['method'] for request in requests] == ['miner_start', auto_dag_method]
+    assert requests[0]['params'] == [2]
@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture
+def seen_methods(web3):
+    seen = []
+
+    def recording_middleware(make_request, web3):
+        def middleware(method, params):
+            seen.append(method)
+            return make_request(method, params)
+        return middleware
+
+    web3.middleware_onion.add(recording_middleware, 'recording')
+    yield seen
+    web3.middleware_onion.remove('recording')
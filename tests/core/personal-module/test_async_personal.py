@@ -0,0 +1,37 @@
+import asyncio
+import pytest
+
+from eth_utils import (
+    is_checksum_address,
+)
+
+from web3 import Web3
+from web3.geth import (
+    AsyncGethPersonal,
+    Geth,
+)
+from web3.providers.eth_tester.main import (
+    AsyncEthereumTesterProvider,
+)
+
+
+@pytest.fixture
+def async_w3():
+    return Web3(
+        AsyncEthereumTesterProvider(),
+        middlewares=[],
+        modules={
+            'geth': (Geth, {'personal': (AsyncGethPersonal,)}),
+        })
+
+
+def test_async_personal_methods_are_coroutine_functions(async_w3):
+    assert asyncio.iscoroutinefunction(async_w3.geth.personal.list_accounts)
+    assert asyncio.iscoroutinefunction(async_w3.geth.personal.unlock_account)
+
+
+@pytest.mark.asyncio
+async def test_async_personal_list_accounts(async_w3):
+    accounts = await async_w3.geth.personal.list_accounts()
+    assert len(accounts) > 0
+    assert all(is_checksum_address(account) for account in accounts)
@@ -0,0 +1,25 @@
+import pytest
+
+
+def test_camel_case_name_resolves_to_snake_case(web3):
+    with pytest.warns(
+        DeprecationWarning,
+        match="listAccounts is deprecated in favor of list_accounts",
+    ):
+        accounts = web3.geth.personal.listAccounts()
+    assert accounts == web3.geth.personal.list_accounts()
+
+
+def test_camel_case_name_with_acronym(web3):
+    with pytest.warns(DeprecationWarning, match="startRPC is deprecated in favor of start_rpc"):
+        web3.geth.admin.startRPC
+
+
+def test_unknown_camel_case_name_raises(web3):
+    with pytest.raises(AttributeError, match="fooBar"):
+        web3.geth.personal.fooBar
+
+
+def test_unknown_snake_case_name_raises(web3):
+    with pytest.raises(AttributeError, match="foo_bar"):
+        web3.geth.miner.foo_bar
@@ -0,0 +1,46 @@
+import pytest
+
+from web3 import Web3
+from web3.geth import (
+    GethPersonal,
+)
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+ADDRESS = '0x844B417c0C58B02c2224306047B9fb0D3264fE8c'
+MESSAGE = 'test-web3-geth-personal-sign'
+SIGNATURE = '0x' + '11' * 65
+
+
+@pytest.fixture(autouse=True)
+def clear_ec_recover_cache():
+    GethPersonal.clear_ec_recover_cache()
+    yield
+    GethPersonal.clear_ec_recover_cache()
+
+
+@pytest.fixture
+def make_post_request(mocker):
+    return mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=f'{{"jsonrpc": "2.0", "id": 0, "result": "{ADDRESS}"}}'.encode(),
+    )
+
+
+def test_ec_recover_caches_recovered_address(make_post_request):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+
+    assert web3.geth.personal.ec_recover(MESSAGE, SIGNATURE) == ADDRESS
+    assert web3.geth.personal.ec_recover(MESSAGE, SIGNATURE) == ADDRESS
+    assert make_post_request.call_count == 1
+
+
+def test_clear_ec_recover_cache(make_post_request):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+
+    web3.geth.personal.ec_recover(MESSAGE, SIGNATURE)
+    GethPersonal.clear_ec_recover_cache()
+    web3.geth.personal.ec_recover(MESSAGE, SIGNATURE)
+    assert make_post_request.call_count == 2
@@ -0,0 +1,36 @@
+import pytest
+
+from eth_utils import (
+    is_checksum_address,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_fast_path(web3):
+    yield
+    web3.geth.personal.fast_path = False
+
+
+def test_list_accounts_uses_middlewares_by_default(web3, seen_methods):
+    web3.geth.personal.list_accounts()
+    assert seen_methods == ['personal_listAccounts']
+
+
+def test_list_accounts_fast_path_skips_middlewares(web3, seen_methods):
+    expected = web3.geth.personal.list_accounts()
+    seen_methods.clear()
+    # bypass the list_accounts cache, so the request is actually made
+    web3.geth.personal._ttl_cache.clear()
+
+    web3.geth.personal.fast_path = True
+    accounts = web3.geth.personal.list_accounts()
+
+    assert seen_methods == []
+    assert accounts == expected
+    assert all(is_checksum_address(account) for account in accounts)
+
+
+def test_fast_path_ignores_methods_outside_whitelist(web3, seen_methods):
+    web3.geth.personal.fast_path = True
+    web3.geth.personal.new_account('a-password')
+    assert seen_methods == ['personal_newAccount']
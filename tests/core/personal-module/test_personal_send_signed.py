@@ -0,0 +1,118 @@
+import json
+import pytest
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import Web3
+from web3.exceptions import (
+    ValidationError,
+)
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+ACCOUNT = '0x844B417c0C58B02c2224306047B9fb0D3264fE8c'
+TX_HASH = '0x' + 'ab' * 32
+TRANSACTION = {
+    'from': ACCOUNT,
+    'to': '0xd3CdA913deB6f67967B99D67aCDFa1712C293601',
+    'value': 1,
+    'gas': 21000,
+}
+
+
+def batch_response(*results):
+    return json.dumps([
+        {'jsonrpc': '2.0', 'id': request_id, **result}
+        for request_id, result in enumerate(results)
+    ]).encode()
+
+
+@pytest.fixture
+def web3(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    # the gas price strategy middleware looks up the latest block for every transaction
+    mocker.patch.object(web3.eth, 'get_block', return_value={'baseFeePerGas': 10})
+    return web3
+
+
+def test_send_signed_unlocks_sends_and_locks_in_one_request(web3, mocker):
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=batch_response({'result': True}, {'result': TX_HASH}, {'result': True}),
+    )
+    tx_hash = web3.geth.personal.send_signed(TRANSACTION, 'a-passphrase')
+
+    assert tx_hash == HexBytes(TX_HASH)
+    assert make_post_request.call_count == 1
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert [request['method'] for request in requests] == [
+        'personal_unlockAccount',
+        'eth_sendTransaction',
+        'personal_lockAccount',
+    ]
+    assert requests[0]['params'] == [ACCOUNT, 'a-passphrase', 1]
+    assert requests[2]['params'] == [ACCOUNT]
+
+
+def test_send_signed_without_relock(web3, mocker):
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=batch_response({'result': True}, {'result': TX_HASH}),
+    )
+    web3.geth.personal.send_signed(TRANSACTION, 'a-passphrase', duration=10, relock=False)
+
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert [request['method'] for request in requests] == [
+        'personal_unlockAccount',
+        'eth_sendTransaction',
+    ]
+    assert requests[0]['params'] == [ACCOUNT, 'a-passphrase', 10]
+
+
+def test_send_signed_raises_on_error(web3, mocker):
+    mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=batch_response(
+            {'error': {'code': -32000, 'message': 'could not decrypt key with given password'}},
+            {'error': {'code': -32000, 'message': 'authentication needed: password or unlock'}},
+            {'result': True},
+        ),
+    )
+    with pytest.raises(ValueError, match='could not decrypt key'):
+        web3.geth.personal.send_signed(TRANSACTION, 'wrong-passphrase')
+
+
+def test_send_signed_requires_from(web3):
+    with pytest.raises(ValidationError):
+        web3.geth.personal.send_signed({'to': ACCOUNT, 'value': 1}, 'a-passphrase')
+
+
+def test_send_signed_returns_hash_when_relock_fails(web3, mocker):
+    mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=batch_response(
+            {'result': True},
+            {'result': TX_HASH},
+            {'error': {'code': -32000, 'message': 'no key for given address or file'}},
+        ),
+    )
+    with pytest.warns(UserWarning, match=f'could not lock {ACCOUNT} again'):
+        tx_hash = web3.geth.personal.send_signed(TRANSACTION, 'a-passphrase')
+
+    assert tx_hash == HexBytes(TX_HASH)
+
+
+def test_send_signed_runs_the_middlewares(web3, mocker):
+    web3.eth.set_gas_price_strategy(lambda web3, transaction_params: 10)
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=batch_response({'result': True}, {'result': TX_HASH}, {'result': True}),
+    )
+    web3.geth.personal.send_signed(TRANSACTION, 'a-passphrase')
+
+    requests = json.loads(make_post_request.call_args[0][1])
+    assert requests[1]['params'][0]['gasPrice'] == hex(10)
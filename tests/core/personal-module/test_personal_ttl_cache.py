@@ -0,0 +1,57 @@
+from web3.geth import (
+    BaseGethPersonal,
+    GethPersonal,
+)
+
+
+def test_list_accounts_is_cached(web3, seen_methods):
+    accounts = web3.geth.personal.list_accounts()
+    assert web3.geth.personal.list_accounts() == accounts
+    assert seen_methods == ['personal_listAccounts']
+
+
+def test_new_account_invalidates_list_accounts(web3, seen_methods):
+    accounts = web3.geth.personal.list_accounts()
+    new_account = web3.geth.personal.new_account('a-password')
+
+    assert set(web3.geth.personal.list_accounts()) == set(accounts) | {new_account}
+    assert seen_methods == [
+        'personal_listAccounts',
+        'personal_newAccount',
+        'personal_listAccounts',
+    ]
+
+
+def test_batched_new_account_invalidates_list_accounts(web3):
+    accounts = web3.geth.personal.list_accounts()
+    new_account, = web3.geth.personal.batch(('new_account', ('a-password',)))
+
+    assert set(web3.geth.personal.list_accounts()) == set(accounts) | {new_account}
+
+
+def test_zero_ttl_disables_caching(web3, seen_methods, monkeypatch):
+    monkeypatch.setattr(type(web3.geth.personal), 'accounts_cache_ttl', 0)
+    web3.geth.personal.list_accounts()
+    web3.geth.personal.list_accounts()
+    assert seen_methods == ['personal_listAccounts', 'personal_listAccounts']
+
+
+def test_subclass_overrides_are_kept():
+    class CustomPersonal(GethPersonal):
+        def list_accounts(self):
+            return []
+
+    class CustomPersonalChild(CustomPersonal):
+        pass
+
+    assert CustomPersonalChild.list_accounts is CustomPersonal.list_accounts
+    assert CustomPersonalChild.new_account is GethPersonal.new_account
+
+
+def test_direct_subclass_overrides_are_kept():
+    class CustomPersonal(BaseGethPersonal):
+        def list_accounts(self):
+            return ['mine']
+
+    assert CustomPersonal.list_accounts(None) == ['mine']
+    assert CustomPersonal.new_account.__name__ == 'new_account'
@@ -0,0 +1,61 @@
+import pytest
+
+from eth_account import (
+    Account,
+)
+from eth_account.messages import (
+    encode_defunct,
+)
+
+from web3 import Web3
+from web3.geth import (
+    GethPersonal,
+)
+from web3.providers import (
+    HTTPProvider,
+)
+
+PRIVATE_KEY_HEX = '0x56ebb41875ceedd42e395f730e03b5c44989393c9f0484ee6bc05f933673458f'
+ADDRESS = '0x844B417c0C58B02c2224306047B9fb0D3264fE8c'
+OTHER_ADDRESS = '0xB96b6B21053e67BA59907E252D990C71742c41B8'
+MESSAGE = 'test-web3-geth-personal-sign'
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    GethPersonal.clear_ec_recover_cache()
+    yield
+    GethPersonal.clear_ec_recover_cache()
+
+
+@pytest.fixture
+def web3():
+    return Web3(HTTPProvider(endpoint_uri="http://mynode.local:8545"))
+
+
+@pytest.fixture
+def signature():
+    signed = Account.sign_message(encode_defunct(text=MESSAGE), PRIVATE_KEY_HEX)
+    return signed.signature
+
+
+def test_verify_matching_address(web3, signature):
+    assert web3.geth.personal.verify(MESSAGE, signature, ADDRESS) is True
+    assert ADDRESS in GethPersonal._public_key_cache
+    # the second check verifies against the cached public key
+    assert web3.geth.personal.verify(MESSAGE, signature.hex(), ADDRESS) is True
+
+
+def test_verify_other_address(web3, signature):
+    assert web3.geth.personal.verify(MESSAGE, signature, OTHER_ADDRESS) is False
+    assert OTHER_ADDRESS not in GethPersonal._public_key_cache
+
+
+def test_verify_other_message(web3, signature):
+    assert web3.geth.personal.verify(MESSAGE, signature, ADDRESS) is True
+    assert web3.geth.personal.verify('another message', signature, ADDRESS) is False
+
+
+@pytest.mark.parametrize('malformed', (b'\x01' * 10, b'', 'zz', '0x', '0x' + 'zz' * 65))
+def test_verify_malformed_signature(web3, malformed):
+    assert web3.geth.personal.verify(MESSAGE, malformed, ADDRESS) is False
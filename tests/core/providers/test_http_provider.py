@@ -44,3 +44,18 @@ def test_user_provided_session():
     assert isinstance(adapter, HTTPAdapter)
     assert adapter._pool_connections == 20
     assert adapter._pool_maxsize == 20
+
+
+def test_make_batch_request_returns_responses_in_request_order(mocker):
+    provider = HTTPProvider(endpoint_uri=URI)
+    # ids are issued from 0, the node answers out of order
+    mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 1, "result": "0x1"},'
+                     b'{"jsonrpc": "2.0", "id": 0, "result": "0x0"}]',
+    )
+    responses = provider.make_batch_request([
+        ('eth_blockNumber', []),
+        ('eth_chainId', []),
+    ])
+    assert [response['result'] for response in responses] == ['0x0', '0x1']
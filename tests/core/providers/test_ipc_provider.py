@@ -86,6 +86,37 @@ def test_sync_waits_for_full_result(jsonrpc_ipc_pipe_path, serve_empty_result):
     provider._socket.sock.close()
 
 
+@pytest.fixture
+def serve_batch_result(simple_ipc_server):
+    def reply():
+        connection, client_address = simple_ipc_server.accept()
+        try:
+            connection.recv(1024)
+            # answered out of order, the provider matches responses by request id
+            connection.sendall(b'[{"jsonrpc": "2.0", "id": 1, "result": "0x1"},')
+            time.sleep(0.1)
+            connection.sendall(b'{"jsonrpc": "2.0", "id": 0, "result": "0x0"}]')
+        finally:
+            # Clean up the connection
+            connection.close()
+            simple_ipc_server.close()
+
+    thd = Thread(target=reply, daemon=True)
+    thd.start()
+
+    try:
+        yield
+    finally:
+        thd.join()
+
+
+def test_make_batch_request(jsonrpc_ipc_pipe_path, serve_batch_result):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3)
+    responses = provider.make_batch_request([('eth_blockNumber', []), ('eth_chainId', [])])
+    assert [response['result'] for response in responses] == ['0x0', '0x1']
+    provider._socket.sock.close()
+
+
 def test_web3_auto_gethdev():
     assert isinstance(w3.provider, IPCProvider)
     return_block_with_long_extra_data = construct_fixture_middleware({
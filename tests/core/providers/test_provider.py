@@ -1,7 +1,20 @@
+import json
+import pytest
+
 from web3 import Web3
+from web3._utils.encoding import (
+    FriendlyJsonSerde,
+)
+from web3._utils.rpc_templates import (
+    ZERO_ARG_REQUEST_TEMPLATES,
+)
+from web3.exceptions import (
+    BadResponseFormat,
+)
 from web3.providers import (
     AutoProvider,
     BaseProvider,
+    JSONBaseProvider,
 )
 
 
@@ -51,3 +64,81 @@ def test_autoprovider_detection():
     assert w3.isConnected()
 
     assert isinstance(auto._active_provider, ConnectedProvider)
+
+
+@pytest.mark.parametrize('method', ZERO_ARG_REQUEST_TEMPLATES)
+@pytest.mark.parametrize('params', ([], (), None))
+def test_encode_rpc_request_from_template(method, params):
+    provider = JSONBaseProvider()
+    first = provider.encode_rpc_request(method, params)
+    second = provider.encode_rpc_request(method, params)
+
+    assert first == FriendlyJsonSerde().json_encode({
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": [],
+        "id": 0,
+    }).encode()
+    assert json.loads(second)['id'] == 1
+
+
+def test_encode_rpc_request_with_params_skips_template():
+    provider = JSONBaseProvider()
+    request = json.loads(provider.encode_rpc_request('txpool_content', ['0x1']))
+    assert request['params'] == ['0x1']
+
+
+def test_encode_batch_rpc_request_returns_request_ids():
+    provider = JSONBaseProvider()
+    provider.encode_rpc_request('eth_chainId', [])
+
+    request_data, request_ids = provider.encode_batch_rpc_request([
+        ('eth_blockNumber', []),
+        ('txpool_status', []),
+    ])
+
+    assert request_ids == [1, 2]
+    assert [request['id'] for request in json.loads(request_data)] == request_ids
+
+
+def test_decode_batch_rpc_response_matches_null_id_errors():
+    provider = JSONBaseProvider()
+    raw_response = json.dumps([
+        {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'invalid request'}},
+        {'jsonrpc': '2.0', 'id': 3, 'result': '0x3'},
+    ]).encode()
+
+    responses = provider.decode_batch_rpc_response(raw_response, [3, 4])
+
+    assert responses[0]['result'] == '0x3'
+    assert responses[1]['error']['message'] == 'invalid request'
+
+
+def test_decode_batch_rpc_response_raises_node_error_for_rejected_batch():
+    provider = JSONBaseProvider()
+    raw_response = json.dumps({
+        'jsonrpc': '2.0',
+        'id': None,
+        'error': {'code': -32700, 'message': 'parse error'},
+    }).encode()
+
+    with pytest.raises(ValueError, match='parse error'):
+        provider.decode_batch_rpc_response(raw_response, [0, 1])
+
+
+def test_decode_batch_rpc_response_with_missing_response():
+    provider = JSONBaseProvider()
+    raw_response = b'[{"jsonrpc": "2.0", "id": 0, "result": "0x0"}]'
+
+    with pytest.raises(BadResponseFormat):
+        provider.decode_batch_rpc_response(raw_response, [0, 1])
+
+
+def test_make_batch_request_falls_back_to_sequential_requests():
+    class EchoProvider(BaseProvider):
+        def make_request(self, method, params):
+            return {'jsonrpc': '2.0', 'id': 0, 'result': method}
+
+    responses = EchoProvider().make_batch_request([('eth_chainId', []), ('eth_mining', [])])
+
+    assert [response['result'] for response in responses] == ['eth_chainId', 'eth_mining']
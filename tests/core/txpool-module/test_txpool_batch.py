@@ -0,0 +1,76 @@
+import pytest
+
+from web3 import Web3
+from web3.providers import (
+    HTTPProvider,
+)
+
+URI = "http://mynode.local:8545"
+
+
+@pytest.fixture(autouse=True)
+def skip_testrpc_and_wait_for_mining_start():
+    # overrides the conftest fixture: these tests mock the transport and need no node
+    pass
+
+
+def test_geth_txpool_batch(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 0, "result": {"pending": "0x1", "queued": "0x0"}},'
+                     b'{"jsonrpc": "2.0", "id": 1, "result": {"pending": {}, "queued": {}}}]',
+    )
+    status, content = web3.geth.txpool.batch(('status', ()), ('content', ()))
+
+    assert make_post_request.call_count == 1
+    request_data = make_post_request.call_args[0][1]
+    assert request_data.startswith(b'[') and request_data.endswith(b']')
+    assert b'"txpool_status"' in request_data
+    assert b'"txpool_content"' in request_data
+    assert status == {'pending': '0x1', 'queued': '0x0'}
+    assert content == {'pending': {}, 'queued': {}}
+
+
+def test_geth_txpool_snapshot(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 2, "result": {"pending": "0x0", "queued": "0x0"}},'
+                     b'{"jsonrpc": "2.0", "id": 0, "result": {"pending": {}, "queued": {}}},'
+                     b'{"jsonrpc": "2.0", "id": 1, "result": {"pending": {}, "queued": {}}}]',
+    )
+    snapshot = web3.geth.txpool.snapshot()
+
+    assert make_post_request.call_count == 1
+    assert snapshot.content == {'pending': {}, 'queued': {}}
+    assert snapshot.inspect == {'pending': {}, 'queued': {}}
+    assert snapshot.status == {'pending': '0x0', 'queued': '0x0'}
+
+
+def test_geth_txpool_empty_batch_sends_nothing(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    make_post_request = mocker.patch('web3.providers.rpc.make_post_request')
+
+    assert web3.geth.txpool.batch() == []
+    assert make_post_request.call_count == 0
+
+
+def test_geth_txpool_batch_runs_the_middlewares(mocker):
+    web3 = Web3(HTTPProvider(endpoint_uri=URI))
+    seen = []
+
+    def recording_middleware(make_request, web3):
+        def middleware(method, params):
+            seen.append(method)
+            return make_request(method, params)
+        return middleware
+
+    web3.middleware_onion.add(recording_middleware)
+    mocker.patch(
+        'web3.providers.rpc.make_post_request',
+        return_value=b'[{"jsonrpc": "2.0", "id": 0, "result": {"pending": {}, "queued": {}}}]',
+    )
+    web3.geth.txpool.batch(('content', ()))
+
+    assert seen == ['txpool_content']
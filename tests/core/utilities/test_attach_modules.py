@@ -162,3 +162,13 @@ def test_attach_external_modules_that_do_not_inherit_from_module_class(
     assert hasattr(w3, 'geth')
     assert hasattr(w3, 'eth')
     assert is_integer(w3.eth.chain_id)
+
+
+def test_geth_submodules_are_slotted():
+    w3 = Web3(EthereumTesterProvider())
+    for module in (w3.geth.personal, w3.geth.txpool, w3.geth.admin, w3.geth.miner):
+        assert not hasattr(module, '__dict__')
+        with pytest.raises(AttributeError):
+            module.some_attribute = 'value'
+    # modules that don't declare __slots__ keep an instance __dict__
+    assert hasattr(w3.geth, '__dict__')
@@ -51,7 +51,8 @@ def test_make_post_request_no_args(mocker):
     adapter = session.get_adapter(URI)
     assert isinstance(adapter, HTTPAdapter)
     assert adapter._pool_connections == DEFAULT_POOLSIZE
-    assert adapter._pool_maxsize == DEFAULT_POOLSIZE
+    assert adapter._pool_maxsize == request.DEFAULT_POOL_MAXSIZE
+    assert adapter._pool_block is False
 
 
 def test_precached_session(mocker):
@@ -80,3 +81,14 @@ def test_precached_session(mocker):
     assert isinstance(adapter, HTTPAdapter)
     assert adapter._pool_connections == 100
     assert adapter._pool_maxsize == 100
+
+
+def test_close_cached_sessions_keeps_sessions_cached(mocker):
+    request._session_cache.clear()
+    session = request._get_session(URI)
+    close = mocker.spy(session, 'close')
+
+    request._close_cached_sessions()
+
+    close.assert_called_once_with()
+    assert request._get_session(URI) is session
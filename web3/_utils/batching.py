@@ -0,0 +1,57 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+)
+
+from eth_utils import (
+    is_dict,
+    is_list_like,
+)
+
+from web3.exceptions import (
+    BadResponseFormat,
+)
+from web3.types import (
+    RPCResponse,
+)
+
+
+def match_batch_responses(response: Any, request_ids: Sequence[int]) -> List[RPCResponse]:
+    """
+    Return the responses to a JSON-RPC batch in the order of ``request_ids``, the ids
+    the batched requests were sent with. Nodes may answer a batch in any order.
+    """
+    if is_dict(response) and 'error' in response:
+        # the batch was rejected as a whole, e.g. because it was empty or not valid JSON
+        raise ValueError(response['error'])
+    if not is_list_like(response):
+        raise BadResponseFormat(
+            "Expected a list of responses to the batch request. "
+            f"The raw response is: {response}"
+        )
+
+    responses_by_id: Dict[int, RPCResponse] = {}
+    # errors for requests the node could not parse come back with a null id
+    unmatched: List[RPCResponse] = []
+    for item in response:
+        if not is_dict(item):
+            continue
+        if item.get('id') in request_ids:
+            responses_by_id[item['id']] = item
+        else:
+            unmatched.append(item)
+
+    responses = []
+    for request_id in request_ids:
+        if request_id in responses_by_id:
+            responses.append(responses_by_id[request_id])
+        elif unmatched:
+            responses.append(unmatched.pop(0))
+        else:
+            raise BadResponseFormat(
+                f"No response to the batched request with id {request_id}. "
+                f"The raw response is: {response}"
+            )
+    return responses
@@ -1,7 +1,16 @@
+import asyncio
 import collections
+import copy
 import hashlib
+import time
 from typing import (
     Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Tuple,
+    TypeVar,
 )
 
 from eth_utils import (
@@ -15,6 +24,8 @@ from eth_utils import (
     to_bytes,
 )
 
+TValue = TypeVar("TValue")
+
 
 def generate_cache_key(value: Any) -> str:
     """
@@ -43,3 +54,91 @@ def generate_cache_key(value: Any) -> str:
             value,
             type(value),
         ))
+
+
+class RequestCoalescer:
+    """
+    Runs at most one coroutine per key at a time. Callers asking for a key that is
+    already in flight await the running call instead of starting another one.
+    """
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def call(self, key: Hashable, fn: Callable[[], Awaitable[TValue]]) -> TValue:
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a cancelled caller must not cancel the call for the others awaiting it
+        return await asyncio.shield(future)
+
+
+class TTLCache:
+    """
+    Caches values for ``ttl`` seconds. ``None`` is never cached, so it is used to
+    signal a miss. Values are copied in and out, so callers may mutate what they get.
+    """
+    def __init__(self) -> None:
+        # key -> (value, expires_at)
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        # bumped on invalidation, so results fetched before it are not cached
+        self._generations: Dict[Hashable, int] = {}
+        self._clear_count = 0
+        self._refreshing = RequestCoalescer()
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return copy.deepcopy(entry[0])
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (copy.deepcopy(value), time.monotonic() + ttl)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._clear_count += 1
+
+    def _generation(self, key: Hashable) -> Tuple[int, int]:
+        return self._clear_count, self._generations.get(key, 0)
+
+    def get_or_call(self, key: Hashable, ttl: float, fn: Callable[[], TValue]) -> TValue:
+        if ttl <= 0:
+            return fn()
+        value = self.get(key)
+        if value is None:
+            generation = self._generation(key)
+            value = fn()
+            if self._generation(key) == generation:
+                self.set(key, value, ttl)
+        return value
+
+    async def async_get_or_call(
+        self, key: Hashable, ttl: float, fn: Callable[[], Awaitable[TValue]]
+    ) -> TValue:
+        if ttl <= 0:
+            return await fn()
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        async def refresh() -> TValue:
+            generation = self._generation(key)
+            value = await fn()
+            # an invalidation during the call means the value may already be outdated
+            if self._generation(key) == generation:
+                self.set(key, value, ttl)
+            return value
+
+        # only one coroutine refreshes a key at a time, the others wait for its result,
+        # each getting its own copy
+        return copy.deepcopy(await self._refreshing.call(key, refresh))
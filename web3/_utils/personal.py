@@ -4,12 +4,20 @@ from typing import (
     Dict,
     List,
     Optional,
+    Union,
 )
 
+from eth_keys import (
+    keys,
+)
 from eth_typing import (
     ChecksumAddress,
     HexStr,
 )
+from eth_utils import (
+    keccak,
+    to_bytes,
+)
 from hexbytes import (
     HexBytes,
 )
@@ -30,6 +38,32 @@ from web3.types import (
     TxParams,
 )
 
+
+def hash_personal_message(message: Union[str, bytes]) -> bytes:
+    """
+    Hash ``message`` the way ``personal_sign`` and ``personal_ecRecover`` do, following the
+    EIP-191 "personal message" format. Strings are treated as text, as in the request formatter.
+    """
+    message_bytes = to_bytes(text=message) if isinstance(message, str) else to_bytes(message)
+    prefix = b"\x19Ethereum Signed Message:\n" + str(len(message_bytes)).encode()
+    return keccak(prefix + message_bytes)
+
+
+def to_signature(signature: Union[HexStr, bytes]) -> keys.Signature:
+    """
+    Convert a 65 byte ``r || s || v`` signature, as returned by ``personal_sign``, to an
+    ``eth_keys`` signature. Both the 27/28 and 0/1 conventions for ``v`` are accepted.
+    Raises ``ValueError`` if ``signature`` is not 65 bytes of valid hex or bytes.
+    """
+    signature_bytes = HexBytes(signature)
+    if len(signature_bytes) != 65:
+        raise ValueError(f"Expected a 65 byte signature, got {len(signature_bytes)} bytes")
+    v = signature_bytes[-1]
+    if v >= 27:
+        v -= 27
+    return keys.Signature(signature_bytes[:-1] + bytes([v]))
+
+
 import_raw_key: Method[Callable[[str, str], ChecksumAddress]] = Method(
     RPC.personal_importRawKey,
     mungers=[default_root_munger],
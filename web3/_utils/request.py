@@ -12,6 +12,9 @@ from eth_typing import (
 )
 import lru
 import requests
+from requests.adapters import (
+    HTTPAdapter,
+)
 
 from web3._utils.caching import (
     generate_cache_key,
@@ -33,11 +36,31 @@ def _remove_session(key: str, session: requests.Session) -> None:
 
 _session_cache = lru.LRU(8, callback=_remove_session)
 
+# Connections kept alive per host by sessions created here. Requests beyond that, e.g.
+# from many threads sharing a provider, open a connection that is discarded afterwards
+# instead of waiting for a pooled one.
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def _close_cached_sessions() -> None:
+    # A forked child must not share the parent's pooled sockets. Closing the sessions only
+    # drops their connections: they stay cached and reconnect on the next request.
+    for session in _session_cache.values():
+        session.close()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_close_cached_sessions)
+
 
 def _get_session(endpoint_uri: URI) -> requests.Session:
     cache_key = generate_cache_key(endpoint_uri)
     if cache_key not in _session_cache:
-        _session_cache[cache_key] = requests.Session()
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session_cache[cache_key] = session
     return _session_cache[cache_key]
 
 
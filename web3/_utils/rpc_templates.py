@@ -0,0 +1,29 @@
+from typing import (
+    Dict,
+)
+
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+
+def _request_template(method: RPCEndpoint) -> bytes:
+    # byte for byte what ``FriendlyJsonSerde().json_encode`` produces, with a slot for the id
+    return b'{"jsonrpc": "2.0", "method": "%s", "params": [], "id": %%d}' % method.encode()
+
+
+# Request bodies for methods that are frequently called without parameters. Only the
+# request id differs between two calls, so it's the only part encoded on each request.
+ZERO_ARG_REQUEST_TEMPLATES: Dict[RPCEndpoint, bytes] = {
+    method: _request_template(method) for method in (
+        RPC.admin_nodeInfo,
+        RPC.admin_peers,
+        RPC.personal_listAccounts,
+        RPC.txpool_content,
+        RPC.txpool_inspect,
+        RPC.txpool_status,
+    )
+}
@@ -1,303 +1,717 @@
+import re
 from typing import (
+    TYPE_CHECKING,
     Any,
-    Awaitable,
+    Callable,
     Dict,
     List,
     Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
+import warnings
 
+from eth_keys.datatypes import (
+    PublicKey,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+    ValidationError as EthKeysValidationError,
+)
 from eth_typing.encoding import (
     HexStr,
 )
 from eth_typing.evm import (
+    BlockNumber,
     ChecksumAddress,
 )
-from hexbytes.main import (
+from eth_utils import (
+    to_checksum_address,
+)
+from hexbytes import (
     HexBytes,
 )
+import lru
 
 from web3._utils.admin import (
     add_peer,
-    addPeer,
+    admin_start_params_munger,
     datadir,
     node_info,
-    nodeInfo,
     peers,
     start_rpc,
     start_ws,
-    startRPC,
-    startWS,
     stop_rpc,
     stop_ws,
-    stopRPC,
-    stopWS,
+)
+from web3._utils.caching import (
+    RequestCoalescer,
+    TTLCache,
 )
 from web3._utils.miner import (
     make_dag,
-    makeDag,
     set_etherbase,
     set_extra,
     set_gas_price,
-    setEtherbase,
-    setExtra,
-    setGasPrice,
     start,
     start_auto_dag,
-    startAutoDag,
     stop,
     stop_auto_dag,
-    stopAutoDag,
 )
 from web3._utils.personal import (
     ec_recover,
-    ecRecover,
+    hash_personal_message,
     import_raw_key,
-    importRawKey,
     list_accounts,
     list_wallets,
-    listAccounts,
     lock_account,
-    lockAccount,
     new_account,
-    newAccount,
     send_transaction,
-    sendTransaction,
     sign,
     sign_typed_data,
-    signTypedData,
+    to_signature,
     unlock_account,
-    unlockAccount,
+)
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3._utils.threads import (
+    Timeout,
 )
 from web3._utils.txpool import (
     content,
     inspect,
     status,
 )
+from web3.exceptions import (
+    ValidationError,
+)
+from web3.method import (
+    Method,
+    default_root_munger,
+)
 from web3.module import (
+    BatchCall,
     Module,
+    _coro_prepare_batch_calls,
+    _format_batch_response,
+    _prepare_batch_calls,
+    lookup_method,
+    make_async_batch_request,
+    make_blocking_batch_request,
+)
+from web3.providers.base import (
+    BaseProvider,
 )
 from web3.types import (
     GethWallet,
+    NodeInfo,
+    RPCEndpoint,
+    RPCResponse,
     TxParams,
     TxPoolContent,
     TxPoolInspect,
+    TxPoolSnapshot,
     TxPoolStatus,
+    Wei,
 )
 
+if TYPE_CHECKING:
+    from web3 import Web3  # noqa: F401
 
-class BaseGethPersonal(Module):
-    """
-    https://github.com/ethereum/go-ethereum/wiki/management-apis#personal
-    """
-    _ec_recover = ec_recover
-    _import_raw_key = import_raw_key
-    _list_accounts = list_accounts
-    _list_wallets = list_wallets
-    _lock_account = lock_account
-    _new_account = new_account
-    _send_transaction = send_transaction
-    _sign = sign
-    _sign_typed_data = sign_typed_data
-    _unlock_account = unlock_account
-    # deprecated
-    _ecRecover = ecRecover
-    _importRawKey = importRawKey
-    _listAccounts = listAccounts
-    _lockAccount = lockAccount
-    _newAccount = newAccount
-    _sendTransaction = sendTransaction
-    _signTypedData = signTypedData
-    _unlockAccount = unlockAccount
+BatchRequest = Tuple[str, Sequence[Any]]
 
+_CAMEL_CASE_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+_snake_case_names: Dict[str, str] = {}
 
-class GethPersonal(BaseGethPersonal):
-    is_async = False
 
-    def ec_recover(self, message: str, signature: HexStr) -> ChecksumAddress:
-        return self._ec_recover(message, signature)
+def _is_camel_case(name: str) -> bool:
+    return name[:1].islower() and not name.islower()
 
-    def import_raw_key(self, private_key: str, passphrase: str) -> ChecksumAddress:
-        return self._import_raw_key(private_key, passphrase)
 
-    def list_accounts(self) -> List[ChecksumAddress]:
-        return self._list_accounts()
+def _camel_to_snake(name: str) -> str:
+    try:
+        return _snake_case_names[name]
+    except KeyError:
+        snake_name = _CAMEL_CASE_BOUNDARY.sub(r'\1_\2', name).lower()
+        _snake_case_names[name] = snake_name
+        return snake_name
 
-    def list_wallets(self) -> List[GethWallet]:
-        return self._list_wallets()
 
-    def lock_account(self, account: ChecksumAddress) -> bool:
-        return self._lock_account(account)
+def _batches_natively(provider: Any) -> bool:
+    # the BaseProvider default sends a batch one request at a time
+    make_batch_request = getattr(type(provider), 'make_batch_request', None)
+    return make_batch_request not in (None, BaseProvider.make_batch_request)
 
-    def new_account(self, passphrase: str) -> ChecksumAddress:
-        return self._new_account(passphrase)
 
-    def send_transaction(self, transaction: TxParams, passphrase: str) -> HexBytes:
-        return self._send_transaction(transaction, passphrase)
+# eth_sendTransaction without the Eth module's munger, which needs the Eth module's default
+# account. Used in personal batches that unlock the sending account in the same request.
+_eth_send_transaction: Method[Callable[[TxParams], HexBytes]] = Method(
+    RPC.eth_sendTransaction,
+    mungers=[default_root_munger],
+)
 
-    def sign(self, message: str, account: ChecksumAddress, password: Optional[str]) -> HexStr:
-        return self._sign(message, account, password)
+_eth_mining: Method[Callable[[], bool]] = Method(
+    RPC.eth_mining,
+    mungers=None,
+)
 
-    def sign_typed_data(self,
-                        message: Dict[str, Any],
-                        account: ChecksumAddress,
-                        password: Optional[str]) -> HexStr:
-        return self._sign_typed_data(message, account, password)
 
-    def unlock_account(self,
-                       account: ChecksumAddress,
-                       passphrase: str,
-                       duration: Optional[int] = None) -> bool:
-        return self._unlock_account(account, passphrase, duration)
+def _ttl_cached_caller(name: str, method: Method[Any], is_async: bool) -> Callable[..., Any]:
+    def blocking_caller(self: "BaseGethPersonal") -> Any:
+        return self._ttl_cache.get_or_call(name, self.accounts_cache_ttl, method.__get__(self))
 
-    def ecRecover(self, message: str, signature: HexStr) -> ChecksumAddress:
-        return self._ecRecover(message, signature)
+    async def async_caller(self: "BaseGethPersonal") -> Any:
+        return await self._ttl_cache.async_get_or_call(
+            name, self.accounts_cache_ttl, method.__get__(self)
+        )
 
-    def importRawKey(self, private_key: str, passphrase: str) -> ChecksumAddress:
-        return self._importRawKey(private_key, passphrase)
+    caller = async_caller if is_async else blocking_caller
+    caller.__name__ = name
+    return caller
 
-    def listAccounts(self) -> List[ChecksumAddress]:
-        return self._listAccounts()
 
-    def lockAccount(self, account: ChecksumAddress) -> bool:
-        return self._lockAccount(account)
+def _invalidating_caller(
+    name: str, method: Method[Any], keys: Tuple[str, ...], is_async: bool
+) -> Callable[..., Any]:
+    def blocking_caller(self: "BaseGethPersonal", *args: Any, **kwargs: Any) -> Any:
+        result = method.__get__(self)(*args, **kwargs)
+        self._ttl_cache.invalidate(*keys)
+        return result
 
-    def newAccount(self, passphrase: str) -> ChecksumAddress:
-        return self._newAccount(passphrase)
+    async def async_caller(self: "BaseGethPersonal", *args: Any, **kwargs: Any) -> Any:
+        result = await method.__get__(self)(*args, **kwargs)
+        self._ttl_cache.invalidate(*keys)
+        return result
 
-    def sendTransaction(self, transaction: TxParams, passphrase: str) -> HexBytes:
-        return self._sendTransaction(transaction, passphrase)
+    caller = async_caller if is_async else blocking_caller
+    caller.__name__ = name
+    return caller
 
-    def signTypedData(self,
-                      message: Dict[str, Any],
-                      account: ChecksumAddress,
-                      password: Optional[str] = None) -> HexStr:
-        return self._signTypedData(message, account, password)
 
-    def unlockAccount(self,
-                      account: ChecksumAddress,
-                      passphrase: str,
-                      duration: Optional[int] = None) -> bool:
-        return self._unlockAccount(account, passphrase, duration)
+def _to_batch_calls(module: Module, requests: Sequence[BatchRequest]) -> List[BatchCall]:
+    return [(lookup_method(module, f"_{name}"), args) for name, args in requests]
 
 
-class AsyncGethPersonal(BaseGethPersonal):
-    is_async = True
+class DeprecatedCamelCaseModule(Module):
+    """
+    Resolves the deprecated camelCase method names, e.g. ``ecRecover``, to their
+    snake_case replacements, emitting a ``DeprecationWarning``.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # only called once regular attribute lookup has failed
+        if _is_camel_case(name):
+            snake_name = _camel_to_snake(name)
+            try:
+                attr = getattr(self, snake_name)
+            except AttributeError:
+                pass
+            else:
+                warnings.warn(
+                    f"{name} is deprecated in favor of {snake_name}",
+                    category=DeprecationWarning,
+                )
+                return attr
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+class BaseGethPersonal(DeprecatedCamelCaseModule):
+    """
+    https://github.com/ethereum/go-ethereum/wiki/management-apis#personal
+    """
+    __slots__ = ('_ttl_cache',)
+
+    # seconds for which list_accounts and list_wallets results are reused
+    accounts_cache_ttl = 5.0
+
+    # ecRecover is deterministic, so recovered addresses are cached by (message, signature).
+    # The cache is bounded so that it can't be grown without limit by untrusted input.
+    _ec_recover_cache: "lru.LRU[Tuple[str, HexStr], ChecksumAddress]" = lru.LRU(4096)
+    # public keys recovered by ``verify``, so later checks against a known address can
+    # verify the signature instead of recovering the key again
+    _public_key_cache: "lru.LRU[ChecksumAddress, PublicKey]" = lru.LRU(256)
+
+    _FAST_METHODS = frozenset({RPC.personal_listAccounts})
+
+    _ec_recover = ec_recover
+    _import_raw_key = import_raw_key
+    _list_accounts = list_accounts
+    _list_wallets = list_wallets
+    _lock_account = lock_account
+    _new_account = new_account
+    _send_transaction = send_transaction
+    _sign = sign
+    _sign_typed_data = sign_typed_data
+    _unlock_account = unlock_account
 
-    async def ec_recover(self, message: str, signature: HexStr) -> Awaitable[ChecksumAddress]:
-        return await self._ec_recover(message, signature)  # type: ignore
+    # methods whose results are reused for ``accounts_cache_ttl`` seconds
+    _ttl_cached_methods: Tuple[Tuple[str, Method[Any]], ...] = (
+        ('list_accounts', list_accounts),
+        ('list_wallets', list_wallets),
+    )
+    # methods that change accounts or wallets, with the cached results they invalidate
+    _invalidating_methods: Tuple[Tuple[str, Method[Any], Tuple[str, ...]], ...] = (
+        ('import_raw_key', import_raw_key, ('list_accounts', 'list_wallets')),
+        ('lock_account', lock_account, ('list_wallets',)),
+        ('new_account', new_account, ('list_accounts', 'list_wallets')),
+        ('unlock_account', unlock_account, ('list_wallets',)),
+    )
+
+    def __init__(self, web3: "Web3") -> None:
+        super().__init__(web3)
+        self._ttl_cache = TTLCache()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+        # further subclasses inherit the generated methods, and may override them
+        if BaseGethPersonal not in cls.__bases__:
+            return
+        # methods the subclass defines itself are kept
+        for name, method in cls._ttl_cached_methods:
+            if name not in cls.__dict__:
+                setattr(cls, name, _ttl_cached_caller(name, method, cls.is_async))
+        for name, method, keys in cls._invalidating_methods:
+            if name not in cls.__dict__:
+                setattr(cls, name, _invalidating_caller(name, method, keys, cls.is_async))
+
+    def _invalidated_keys(self, requests: Sequence[BatchRequest]) -> Tuple[str, ...]:
+        # the cached results that batching ``requests`` may change
+        names = {name for name, _ in requests}
+        return tuple(
+            key
+            for name, _, keys in self._invalidating_methods if name in names
+            for key in keys
+        )
+
+    @classmethod
+    def clear_ec_recover_cache(cls) -> None:
+        cls._ec_recover_cache.clear()
+        cls._public_key_cache.clear()
+
+    def verify(
+        self, message: Union[str, bytes], signature: Union[HexStr, bytes], expected: ChecksumAddress
+    ) -> bool:
+        """
+        Check whether ``signature`` over ``message``, in the ``personal_sign`` format, was
+        made by ``expected``. This is done locally, without a round trip to the node.
+        """
+        expected = to_checksum_address(expected)
+        message_hash = hash_personal_message(message)
+        try:
+            eth_keys_signature = to_signature(signature)
+            public_key = self._public_key_cache.get(expected)
+            if public_key is not None:
+                return public_key.verify_msg_hash(message_hash, eth_keys_signature)
+            public_key = eth_keys_signature.recover_public_key_from_msg_hash(message_hash)
+        except (BadSignature, EthKeysValidationError, ValueError):
+            # ValueError covers malformed signatures, e.g. bad hex or the wrong length
+            return False
+
+        if public_key.to_checksum_address() != expected:
+            return False
+        self._public_key_cache[expected] = public_key
+        return True
+
+    def _send_signed_calls(
+        self, transaction: TxParams, passphrase: str, duration: int, relock: bool
+    ) -> List[BatchCall]:
+        if 'from' not in transaction:
+            raise ValidationError("Transaction must include a 'from' account to unlock")
+        account = transaction['from']
+        calls: List[BatchCall] = [
+            (unlock_account, (account, passphrase, duration)),
+            (_eth_send_transaction, (transaction,)),
+        ]
+        if relock:
+            calls.append((lock_account, (account,)))
+        return calls
+
+    def _send_signed_result(
+        self,
+        requests: Sequence[Tuple[RPCEndpoint, Any]],
+        formatters: Sequence[Tuple[Any, ...]],
+        responses: Sequence[RPCResponse],
+    ) -> HexBytes:
+        (_, unlock_params), (_, send_params) = requests[:2]
+        try:
+            transaction_hash = _format_batch_response(
+                self.web3, send_params, formatters[1], responses[1]
+            )
+        except ValueError:
+            # report a failed unlock, e.g. a wrong passphrase, as the cause
+            _format_batch_response(self.web3, unlock_params, formatters[0], responses[0])
+            raise
+
+        if len(responses) > 2:
+            _, lock_params = requests[2]
+            try:
+                _format_batch_response(self.web3, lock_params, formatters[2], responses[2])
+            except ValueError as err:
+                # the transaction was sent, raising here would invite sending it again
+                warnings.warn(
+                    f"Sent transaction {HexBytes(transaction_hash).hex()}, but could not "
+                    f"lock {to_checksum_address(lock_params[0])} again: {err}"
+                )
+        return transaction_hash
 
-    async def import_raw_key(self, private_key: str, passphrase: str) -> Awaitable[ChecksumAddress]:
-        return await self._import_raw_key(private_key, passphrase)  # type: ignore
 
-    async def list_accounts(self) -> Awaitable[List[ChecksumAddress]]:
-        return await self._list_accounts()  # type: ignore
+class GethPersonal(BaseGethPersonal):
+    __slots__ = ()
+    is_async = False
+
+    send_transaction = send_transaction
+    sign = sign
+    sign_typed_data = sign_typed_data
 
-    async def list_wallets(self) -> Awaitable[List[GethWallet]]:
-        return await self._list_wallets()  # type: ignore
+    if TYPE_CHECKING:
+        # generated by BaseGethPersonal.__init_subclass__
+        def import_raw_key(self, private_key: str, passphrase: str) -> ChecksumAddress:
+            ...
 
-    async def lock_account(self, account: ChecksumAddress) -> Awaitable[bool]:
-        return await self._lock_account(account)  # type: ignore
+        def list_accounts(self) -> List[ChecksumAddress]:
+            ...
 
-    async def new_account(self, passphrase: str) -> Awaitable[ChecksumAddress]:
-        return await self._new_account(passphrase)  # type: ignore
+        def list_wallets(self) -> List[GethWallet]:
+            ...
 
-    async def send_transaction(self, transaction: TxParams, passphrase: str) -> Awaitable[HexBytes]:
-        return await self._send_transaction(transaction, passphrase)  # type: ignore
+        def lock_account(self, account: ChecksumAddress) -> bool:
+            ...
 
-    async def sign(self,
-                   message: str,
-                   account: ChecksumAddress,
-                   password: Optional[str]) -> Awaitable[HexStr]:
-        return await self._sign(message, account, password)  # type: ignore
+        def new_account(self, passphrase: str) -> ChecksumAddress:
+            ...
 
-    async def sign_typed_data(self,
-                              message: Dict[str, Any],
-                              account: ChecksumAddress,
-                              password: Optional[str]) -> Awaitable[HexStr]:
-        return await self._sign_typed_data(message, account, password)  # type: ignore
+        def unlock_account(
+            self, account: ChecksumAddress, passphrase: str, duration: Optional[int] = None
+        ) -> bool:
+            ...
+
+    def ec_recover(self, message: str, signature: HexStr) -> ChecksumAddress:
+        cache_key = (message, signature)
+        address = self._ec_recover_cache.get(cache_key)
+        if address is None:
+            address = self._ec_recover(message, signature)
+            self._ec_recover_cache[cache_key] = address
+        return address
+
+    def batch(self, *requests: BatchRequest) -> List[Any]:
+        """
+        Send several personal methods to the node as a single JSON-RPC batch, e.g.
+        ``batch(("list_accounts", ()), ("list_wallets", ()))``. Results are returned
+        in the order the requests were given.
+        """
+        try:
+            return make_blocking_batch_request(self.web3, self, _to_batch_calls(self, requests))
+        finally:
+            self._ttl_cache.invalidate(*self._invalidated_keys(requests))
+
+    def send_signed(
+        self, transaction: TxParams, passphrase: str, duration: int = 1, relock: bool = True
+    ) -> HexBytes:
+        """
+        Unlock ``transaction['from']``, send ``transaction`` with ``eth_sendTransaction`` and
+        lock the account again, all in a single JSON-RPC batch request. The node runs the
+        batch in order, so the lock is sent even if sending the transaction fails.
+
+        The requests pass through the middleware onion before being batched, so e.g. ENS
+        names are resolved and the gas price strategy applies as in ``eth.send_transaction``.
+        Once the transaction is sent its hash is returned, a failure to lock the account
+        again only emits a warning.
+        """
+        requests, formatters = _prepare_batch_calls(
+            self.web3, self, self._send_signed_calls(transaction, passphrase, duration, relock)
+        )
+        try:
+            responses = self.web3.provider.make_batch_request(requests)
+        finally:
+            self._ttl_cache.invalidate('list_wallets')
+        return self._send_signed_result(requests, formatters, responses)
+
+
+class AsyncGethPersonal(BaseGethPersonal):
+    __slots__ = ()
+    is_async = True
 
-    async def unlock_account(self,
-                             account: ChecksumAddress,
-                             passphrase: str,
-                             duration: Optional[int] = None) -> Awaitable[bool]:
-        return await self._unlock_account(account, passphrase, duration)  # type: ignore
+    send_transaction = send_transaction
+    sign = sign
+    sign_typed_data = sign_typed_data
+
+    if TYPE_CHECKING:
+        # generated by BaseGethPersonal.__init_subclass__
+        async def import_raw_key(self, private_key: str, passphrase: str) -> ChecksumAddress:
+            ...
+
+        async def list_accounts(self) -> List[ChecksumAddress]:
+            ...
+
+        async def list_wallets(self) -> List[GethWallet]:
+            ...
+
+        async def lock_account(self, account: ChecksumAddress) -> bool:
+            ...
+
+        async def new_account(self, passphrase: str) -> ChecksumAddress:
+            ...
+
+        async def unlock_account(
+            self, account: ChecksumAddress, passphrase: str, duration: Optional[int] = None
+        ) -> bool:
+            ...
+
+    async def ec_recover(self, message: str, signature: HexStr) -> ChecksumAddress:
+        cache_key = (message, signature)
+        address = self._ec_recover_cache.get(cache_key)
+        if address is None:
+            address = await self._ec_recover(message, signature)  # type: ignore
+            self._ec_recover_cache[cache_key] = address
+        return address
+
+    async def batch(self, *requests: BatchRequest) -> List[Any]:
+        try:
+            return await make_async_batch_request(
+                self.web3, self, _to_batch_calls(self, requests)
+            )
+        finally:
+            self._ttl_cache.invalidate(*self._invalidated_keys(requests))
+
+    async def send_signed(
+        self, transaction: TxParams, passphrase: str, duration: int = 1, relock: bool = True
+    ) -> HexBytes:
+        requests, formatters = await _coro_prepare_batch_calls(
+            self.web3, self, self._send_signed_calls(transaction, passphrase, duration, relock)
+        )
+        try:
+            responses = await self.web3.provider.make_batch_request(requests)  # type: ignore
+        finally:
+            self._ttl_cache.invalidate('list_wallets')
+        return self._send_signed_result(requests, formatters, responses)
 
 
 class BaseTxPool(Module):
     """
     https://github.com/ethereum/go-ethereum/wiki/Management-APIs#txpool
     """
+    __slots__ = ()
+
+    _FAST_METHODS = frozenset({RPC.txpool_content, RPC.txpool_inspect, RPC.txpool_status})
+
     _content = content
     _inspect = inspect
     _status = status
 
+    _snapshot_calls: Tuple[BatchCall, ...] = ((content, ()), (inspect, ()), (status, ()))
+
 
 class GethTxPool(BaseTxPool):
+    __slots__ = ()
     is_async = False
 
-    def content(self) -> TxPoolContent:
-        return self._content()
+    content = content
+    inspect = inspect
+    status = status
 
-    def inspect(self) -> TxPoolInspect:
-        return self._inspect()
+    def batch(self, *requests: BatchRequest) -> List[Any]:
+        """
+        Send several txpool methods to the node as a single JSON-RPC batch, e.g.
+        ``batch(("content", ()), ("status", ()))``. Results are returned in the
+        order the requests were given.
+        """
+        return make_blocking_batch_request(self.web3, self, _to_batch_calls(self, requests))
 
-    def status(self) -> TxPoolStatus:
-        return self._status()
+    def snapshot(self) -> TxPoolSnapshot:
+        """
+        Fetch ``content``, ``inspect`` and ``status`` in a single JSON-RPC batch request.
+        """
+        return TxPoolSnapshot(*make_blocking_batch_request(self.web3, self, self._snapshot_calls))
 
 
 class AsyncGethTxPool(BaseTxPool):
+    __slots__ = ('_in_flight',)
     is_async = True
 
-    async def content(self) -> Awaitable[Any]:
-        return await self._content()  # type: ignore
+    def __init__(self, web3: "Web3") -> None:
+        super().__init__(web3)
+        # concurrent calls of the same method share a single request
+        self._in_flight = RequestCoalescer()
+
+    async def content(self) -> TxPoolContent:
+        return await self._in_flight.call('content', self._content)  # type: ignore
+
+    async def inspect(self) -> TxPoolInspect:
+        return await self._in_flight.call('inspect', self._inspect)  # type: ignore
 
-    async def inspect(self) -> Awaitable[Any]:
-        return await self._inspect()  # type: ignore
+    async def status(self) -> TxPoolStatus:
+        return await self._in_flight.call('status', self._status)  # type: ignore
 
-    async def status(self) -> Awaitable[Any]:
-        return await self._status()  # type: ignore
+    async def batch(self, *requests: BatchRequest) -> List[Any]:
+        return await make_async_batch_request(self.web3, self, _to_batch_calls(self, requests))
 
+    async def snapshot(self) -> TxPoolSnapshot:
+        return TxPoolSnapshot(
+            *await make_async_batch_request(self.web3, self, self._snapshot_calls)
+        )
 
-class GethAdmin(Module):
+
+class GethAdmin(DeprecatedCamelCaseModule):
     """
     https://github.com/ethereum/go-ethereum/wiki/Management-APIs#admin
     """
+    __slots__ = ('_ttl_cache',)
+
+    # seconds for which the node_info result is reused, off by default as it includes the
+    # head block and total difficulty of the chain
+    node_info_cache_ttl = 0.0
+
+    _FAST_METHODS = frozenset({RPC.admin_nodeInfo, RPC.admin_peers})
+
+    _node_info = node_info
+
     add_peer = add_peer
-    node_info = node_info
+    datadir = datadir
+    peers = peers
     start_rpc = start_rpc
     start_ws = start_ws
     stop_ws = stop_ws
     stop_rpc = stop_rpc
-    # deprecated
-    addPeer = addPeer
-    datadir = datadir
-    nodeInfo = nodeInfo
-    peers = peers
-    startRPC = startRPC
-    startWS = startWS
-    stopRPC = stopRPC
-    stopWS = stopWS
-
 
-class GethMiner(Module):
+    def __init__(self, web3: "Web3") -> None:
+        super().__init__(web3)
+        self._ttl_cache = TTLCache()
+
+    def node_info(self) -> NodeInfo:
+        return self._ttl_cache.get_or_call('node_info', self.node_info_cache_ttl, self._node_info)
+
+    def start_servers(
+        self,
+        rpc_kwargs: Optional[Dict[str, Any]] = None,
+        ws_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, bool]:
+        """
+        Start the HTTP-RPC and websocket servers with a single JSON-RPC batch request.
+        ``rpc_kwargs`` and ``ws_kwargs`` are passed on as in ``start_rpc`` and ``start_ws``.
+        """
+        rpc_result, ws_result = make_blocking_batch_request(self.web3, self, (
+            (start_rpc, admin_start_params_munger(self, **(rpc_kwargs or {}))),
+            (start_ws, admin_start_params_munger(self, **(ws_kwargs or {}))),
+        ))
+        return rpc_result, ws_result
+
+    def stop_servers(self) -> Tuple[bool, bool]:
+        """
+        Stop the HTTP-RPC and websocket servers with a single JSON-RPC batch request.
+        """
+        rpc_result, ws_result = make_blocking_batch_request(self.web3, self, (
+            (stop_rpc, ()),
+            (stop_ws, ()),
+        ))
+        return rpc_result, ws_result
+
+
+class GethMiner(DeprecatedCamelCaseModule):
     """
     https://github.com/ethereum/go-ethereum/wiki/Management-APIs#miner
     """
+    __slots__ = ('_last_extra', '_last_gas_price', '_last_etherbase')
+
+    _set_extra = set_extra
+    _set_etherbase = set_etherbase
+    _set_gas_price = set_gas_price
+    _is_mining = _eth_mining
+
+    # upper bound, in seconds, for the backoff between checks in make_dag_and_wait_for_mining
+    max_dag_poll_latency = 5.0
+
     make_dag = make_dag
-    set_extra = set_extra
-    set_etherbase = set_etherbase
-    set_gas_price = set_gas_price
     start = start
     stop = stop
     start_auto_dag = start_auto_dag
     stop_auto_dag = stop_auto_dag
-    # deprecated
-    makeDag = makeDag
-    setExtra = setExtra
-    setEtherbase = setEtherbase
-    setGasPrice = setGasPrice
-    startAutoDag = startAutoDag
-    stopAutoDag = stopAutoDag
+
+    def __init__(self, web3: "Web3") -> None:
+        super().__init__(web3)
+        self.invalidate_miner_cache()
+
+    def invalidate_miner_cache(self) -> None:
+        """
+        Forget the values last set through this module, so the next ``set_extra``,
+        ``set_gas_price`` or ``set_etherbase`` call is sent to the node even if unchanged.
+        Use it when the miner may have been reconfigured by someone else.
+        """
+        self._last_extra: Optional[str] = None
+        self._last_gas_price: Optional[Wei] = None
+        self._last_etherbase: Optional[ChecksumAddress] = None
+
+    def set_extra(self, extra: str) -> bool:
+        if extra == self._last_extra:
+            return True
+        result = self._set_extra(extra)
+        if result:
+            self._last_extra = extra
+        return result
+
+    def set_gas_price(self, gas_price: Wei) -> bool:
+        if gas_price == self._last_gas_price:
+            return True
+        result = self._set_gas_price(gas_price)
+        if result:
+            self._last_gas_price = gas_price
+        return result
+
+    def set_etherbase(self, etherbase: ChecksumAddress) -> bool:
+        if etherbase == self._last_etherbase:
+            return True
+        result = self._set_etherbase(etherbase)
+        if result:
+            self._last_etherbase = etherbase
+        return result
+
+    def start_mining(self, num_threads: int, auto_dag: bool = True) -> Tuple[bool, bool]:
+        """
+        Start the miner and switch automatic DAG pregeneration on, or off if ``auto_dag``
+        is false, with a single JSON-RPC batch request.
+        """
+        start_result, auto_dag_result = make_blocking_batch_request(self.web3, self, (
+            (start, (num_threads,)),
+            (start_auto_dag if auto_dag else stop_auto_dag, ()),
+        ))
+        return start_result, auto_dag_result
+
+    def make_dag_and_wait_for_mining(
+        self, block_number: BlockNumber, poll_ms: int = 500, timeout: float = 120
+    ) -> Tuple[bool, bool]:
+        """
+        Generate the DAG for ``block_number``, then wait up to ``timeout`` seconds for the
+        node to report that it is mining. ``miner_makeDag`` returns once the DAG is made;
+        ``eth_mining`` only tells whether the miner is running. Returns the ``make_dag``
+        result and whether the node is mining.
+
+        If the provider supports it, ``miner_makeDag`` and the first ``eth_mining`` check
+        are sent as a single JSON-RPC batch request. Later checks start ``poll_ms`` apart,
+        doubling up to ``max_dag_poll_latency`` seconds. Nothing is awaited if the DAG
+        could not be made.
+        """
+        if _batches_natively(self.web3.provider):
+            dag_result, is_mining = make_blocking_batch_request(self.web3, self, (
+                (make_dag, (block_number,)),
+                (_eth_mining, ()),
+            ))
+        else:
+            dag_result, is_mining = self.make_dag(block_number), False
+        if not dag_result:
+            return dag_result, is_mining
+
+        poll_latency = poll_ms / 1000
+        try:
+            with Timeout(timeout) as _timeout:
+                while not is_mining:
+                    _timeout.sleep(poll_latency)
+                    poll_latency = min(poll_latency * 2, self.max_dag_poll_latency)
+                    is_mining = self._is_mining()
+        except Timeout:
+            pass
+        return dag_result, is_mining
 
 
 class Geth(Module):
@@ -36,8 +36,10 @@ from web3.exceptions import (
 )
 from web3.middleware import (
     abi_middleware,
+    async_combine_middlewares,
     attrdict_middleware,
     buffered_gas_estimate_middleware,
+    combine_middlewares,
     gas_price_strategy_middleware,
     name_to_address_middleware,
     pythonic_middleware,
@@ -62,6 +64,25 @@ if TYPE_CHECKING:
 NULL_RESPONSES = [None, HexBytes('0x'), '0x']
 
 
+class _PreparedRequest(Exception):
+    """
+    Carries a request that reached the end of the middleware onion back out of it,
+    in place of sending it to the provider.
+    """
+    def __init__(self, method: RPCEndpoint, params: Any) -> None:
+        super().__init__(method, params)
+        self.method = method
+        self.params = params
+
+
+def _raise_prepared_request(method: RPCEndpoint, params: Any) -> NoReturn:
+    raise _PreparedRequest(method, params)
+
+
+async def _async_raise_prepared_request(method: RPCEndpoint, params: Any) -> NoReturn:
+    raise _PreparedRequest(method, params)
+
+
 def apply_error_formatters(
     error_formatters: Callable[..., Any],
     response: RPCResponse,
@@ -159,6 +180,42 @@ class RequestManager:
         self.logger.debug("Making request. Method: %s", method)
         return await request_func(method, params)
 
+    def prepare_request(
+        self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any
+    ) -> Tuple[RPCEndpoint, Any]:
+        """
+        Run a request through the middleware onion, which e.g. resolves ENS names, applies
+        the gas price strategy and estimates gas, and return it as it would reach the
+        provider instead of sending it. Used to include such requests in a batch.
+        """
+        request_func = combine_middlewares(
+            middlewares=tuple(self.middleware_onion) + tuple(self.provider.middlewares),
+            web3=self.web3,
+            provider_request_fn=_raise_prepared_request,
+        )
+        try:
+            request_func(method, params)
+        except _PreparedRequest as prepared:
+            return prepared.method, prepared.params
+        raise ValueError(f"A middleware answered {method} itself, so it cannot be batched")
+
+    async def coro_prepare_request(
+        self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any
+    ) -> Tuple[RPCEndpoint, Any]:
+        """
+        Coroutine counterpart of :meth:`prepare_request`.
+        """
+        request_func = await async_combine_middlewares(
+            middlewares=tuple(self.middleware_onion) + tuple(self.provider.middlewares),
+            web3=self.web3,
+            provider_request_fn=_async_raise_prepared_request,
+        )
+        try:
+            await request_func(method, params)  # type: ignore
+        except _PreparedRequest as prepared:
+            return prepared.method, prepared.params
+        raise ValueError(f"A middleware answered {method} itself, so it cannot be batched")
+
     def formatted_response(
         self,
         response: RPCResponse,
@@ -3,8 +3,13 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    FrozenSet,
+    List,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
 from eth_abi.codec import (
@@ -19,10 +24,14 @@ from web3._utils.filters import (
     LogFilter,
     _UseExistingFilter,
 )
+from web3.exceptions import (
+    BadResponseFormat,
+)
 from web3.method import (
     Method,
 )
 from web3.types import (
+    RPCEndpoint,
     RPCResponse,
 )
 
@@ -54,10 +63,17 @@ def retrieve_blocking_method_call_fn(
         except _UseExistingFilter as err:
             return LogFilter(eth_module=module, filter_id=err.filter_id)
         result_formatters, error_formatters, null_result_formatters = response_formatters
-        result = w3.manager.request_blocking(method_str,
-                                             params,
-                                             error_formatters,
-                                             null_result_formatters)
+        if module.fast_path and method_str in module._FAST_METHODS:
+            response = module._fast_make_request(method_str, params)
+            result = w3.manager.formatted_response(response,
+                                                   params,
+                                                   error_formatters,
+                                                   null_result_formatters)
+        else:
+            result = w3.manager.request_blocking(method_str,
+                                                 params,
+                                                 error_formatters,
+                                                 null_result_formatters)
         return apply_result_formatters(result_formatters, result)
     return caller
 
@@ -69,20 +85,136 @@ def retrieve_async_method_call_fn(
     async def caller(*args: Any, **kwargs: Any) -> RPCResponse:
         (method_str, params), response_formatters = method.process_params(module, *args, **kwargs)
         result_formatters, error_formatters, null_result_formatters = response_formatters
-        result = await w3.manager.coro_request(method_str,
-                                               params,
-                                               error_formatters,
-                                               null_result_formatters)
+        if module.fast_path and method_str in module._FAST_METHODS:
+            response = await module._fast_make_request(method_str, params)
+            result = w3.manager.formatted_response(response,
+                                                   params,
+                                                   error_formatters,
+                                                   null_result_formatters)
+        else:
+            result = await w3.manager.coro_request(method_str,
+                                                   params,
+                                                   error_formatters,
+                                                   null_result_formatters)
         return apply_result_formatters(result_formatters, result)
     return caller
 
 
+BatchCall = Tuple[Method[Any], Sequence[Any]]
+
+
+def _process_batch_calls(
+    module: "Module", calls: Sequence[BatchCall]
+) -> Tuple[List[Tuple[RPCEndpoint, Any]], List[Tuple[Any, ...]]]:
+    requests: List[Tuple[RPCEndpoint, Any]] = []
+    formatters: List[Tuple[Any, ...]] = []
+    for method, args in calls:
+        (method_str, params), response_formatters = method.process_params(module, *args)
+        requests.append((cast(RPCEndpoint, method_str), params))
+        formatters.append(response_formatters)
+    return requests, formatters
+
+
+def _prepare_batch_calls(
+    w3: "Web3", module: "Module", calls: Sequence[BatchCall]
+) -> Tuple[List[Tuple[RPCEndpoint, Any]], List[Tuple[Any, ...]]]:
+    requests, formatters = _process_batch_calls(module, calls)
+    requests = [w3.manager.prepare_request(method, params) for method, params in requests]
+    return requests, formatters
+
+
+async def _coro_prepare_batch_calls(
+    w3: "Web3", module: "Module", calls: Sequence[BatchCall]
+) -> Tuple[List[Tuple[RPCEndpoint, Any]], List[Tuple[Any, ...]]]:
+    requests, formatters = _process_batch_calls(module, calls)
+    requests = [
+        await w3.manager.coro_prepare_request(method, params) for method, params in requests
+    ]
+    return requests, formatters
+
+
+def _format_batch_responses(
+    w3: "Web3",
+    requests: Sequence[Tuple[RPCEndpoint, Any]],
+    formatters: Sequence[Tuple[Any, ...]],
+    responses: Sequence[RPCResponse],
+) -> List[Any]:
+    if len(responses) != len(requests):
+        raise BadResponseFormat(
+            f"Expected {len(requests)} responses to the batch request, got {len(responses)}. "
+            f"The raw response is: {responses}"
+        )
+    return [
+        _format_batch_response(w3, params, response_formatters, response)
+        for (_, params), response_formatters, response in zip(requests, formatters, responses)
+    ]
+
+
+def _format_batch_response(
+    w3: "Web3", params: Any, response_formatters: Tuple[Any, ...], response: RPCResponse
+) -> Any:
+    result_formatters, error_formatters, null_result_formatters = response_formatters
+    result = w3.manager.formatted_response(response,
+                                           params,
+                                           error_formatters,
+                                           null_result_formatters)
+    return apply_result_formatters(result_formatters, result)
+
+
+def make_blocking_batch_request(
+    w3: "Web3", module: "Module", calls: Sequence[BatchCall]
+) -> List[Any]:
+    """
+    Send ``calls``, a sequence of ``(method, args)`` pairs, to the provider as a
+    single JSON-RPC batch and return the formatted results in submission order.
+    The requests pass through the middleware onion before they are batched, the
+    responses only get the result formatters of their methods.
+    """
+    if not calls:
+        # nodes reject an empty batch
+        return []
+    requests, formatters = _prepare_batch_calls(w3, module, calls)
+    responses = w3.provider.make_batch_request(requests)
+    return _format_batch_responses(w3, requests, formatters, responses)
+
+
+async def make_async_batch_request(
+    w3: "Web3", module: "Module", calls: Sequence[BatchCall]
+) -> List[Any]:
+    """
+    Coroutine counterpart of :func:`make_blocking_batch_request`.
+    """
+    if not calls:
+        return []
+    requests, formatters = await _coro_prepare_batch_calls(w3, module, calls)
+    responses = await w3.provider.make_batch_request(requests)  # type: ignore
+    return _format_batch_responses(w3, requests, formatters, responses)
+
+
+def lookup_method(module: "Module", name: str) -> Method[Callable[..., Any]]:
+    """
+    Return the unbound :class:`~web3.method.Method` attached to ``module`` as ``name``.
+    """
+    for klass in type(module).__mro__:
+        attr = vars(klass).get(name)
+        if isinstance(attr, Method):
+            return attr
+    raise AttributeError(f"{type(module).__name__} has no RPC method named '{name}'")
+
+
 #  Module should no longer have access to the full web3 api.
 #  Only the calling functions need access to the request methods.
 #  Any "re-entrant" shenanigans can go in the middlewares, which do
 #  have web3 access.
 class Module:
+    # Subclasses that don't declare __slots__ themselves get a regular __dict__ back
+    __slots__ = ('retrieve_caller_fn', 'web3', 'codec', 'fast_path')
+
     is_async = False
+    # Side-effect free methods that may skip the middleware onion when ``fast_path`` is
+    # enabled. The request and result formatters of the method are still applied.
+    _FAST_METHODS: FrozenSet[RPCEndpoint] = frozenset()
+    fast_path: bool
 
     def __init__(self, web3: "Web3") -> None:
         if self.is_async:
@@ -91,3 +223,11 @@ class Module:
             self.retrieve_caller_fn = retrieve_blocking_method_call_fn(web3, self)
         self.web3 = web3
         self.codec: ABICodec = web3.codec
+        # Opt-in: any middleware, including user supplied ones, is bypassed for _FAST_METHODS
+        self.fast_path = False
+
+    def _fast_make_request(
+        self, method: Union[RPCEndpoint, Callable[..., RPCEndpoint]], params: Any
+    ) -> Any:
+        # returns a coroutine when the provider is async
+        return self.web3.provider.make_request(cast(RPCEndpoint, method), params)
@@ -3,6 +3,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    List,
     Sequence,
     Tuple,
     cast,
@@ -14,9 +15,15 @@ from eth_utils import (
     to_text,
 )
 
+from web3._utils.batching import (
+    match_batch_responses,
+)
 from web3._utils.encoding import (
     FriendlyJsonSerde,
 )
+from web3._utils.rpc_templates import (
+    ZERO_ARG_REQUEST_TEMPLATES,
+)
 from web3.middleware import (
     async_combine_middlewares,
 )
@@ -77,6 +84,16 @@ class AsyncBaseProvider:
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         raise NotImplementedError("Providers must implement this method")
 
+    async def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        """
+        Send ``requests``, a sequence of ``(method, params)`` pairs, and return the responses
+        in the same order. Providers that can send a JSON-RPC batch in a single round trip
+        override this. By default the requests are sent one at a time.
+        """
+        return [await self.make_request(method, params) for method, params in requests]
+
     async def isConnected(self) -> bool:
         raise NotImplementedError("Providers must implement this method")
 
@@ -86,19 +103,42 @@ class AsyncJSONBaseProvider(AsyncBaseProvider):
         self.request_counter = itertools.count()
 
     def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        return self._encode_rpc_request(method, params, next(self.request_counter))
+
+    def _encode_rpc_request(self, method: RPCEndpoint, params: Any, request_id: int) -> bytes:
+        if not params and method in ZERO_ARG_REQUEST_TEMPLATES:
+            return ZERO_ARG_REQUEST_TEMPLATES[method] % request_id
         rpc_dict = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params or [],
-            "id": next(self.request_counter),
+            "id": request_id,
         }
         encoded = FriendlyJsonSerde().json_encode(rpc_dict)
         return to_bytes(text=encoded)
 
+    def encode_batch_rpc_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> Tuple[bytes, List[int]]:
+        """
+        Return the encoded batch and the ids of its requests, in order.
+        """
+        request_ids = [next(self.request_counter) for _ in requests]
+        encoded = b'[' + b','.join(
+            self._encode_rpc_request(method, params, request_id)
+            for (method, params), request_id in zip(requests, request_ids)
+        ) + b']'
+        return encoded, request_ids
+
     def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
         text_response = to_text(raw_response)
         return cast(RPCResponse, FriendlyJsonSerde().json_decode(text_response))
 
+    def decode_batch_rpc_response(
+        self, raw_response: bytes, request_ids: Sequence[int]
+    ) -> List[RPCResponse]:
+        return match_batch_responses(self.decode_rpc_response(raw_response), request_ids)
+
     async def isConnected(self) -> bool:
         try:
             response = await self.make_request(RPCEndpoint('web3_clientVersion'), [])
@@ -3,7 +3,9 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
@@ -80,3 +82,19 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
                           "Method: %s, Response: %s",
                           self.endpoint_uri, method, response)
         return response
+
+    async def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request HTTP. URI: %s, Methods: %s",
+                          self.endpoint_uri, [method for method, _ in requests])
+        request_data, request_ids = self.encode_batch_rpc_request(requests)
+        raw_response = await async_make_post_request(
+            self.endpoint_uri,
+            request_data,
+            **self.get_request_kwargs()
+        )
+        response = self.decode_batch_rpc_response(raw_response, request_ids)
+        self.logger.debug("Getting batch response HTTP. URI: %s, Response: %s",
+                          self.endpoint_uri, response)
+        return response
@@ -14,10 +14,16 @@ from types import (
 )
 from typing import (
     Any,
+    List,
+    Sequence,
+    Tuple,
     Type,
     Union,
 )
 
+from web3._utils.batching import (
+    match_batch_responses,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -234,7 +240,17 @@ class IPCProvider(JSONBaseProvider):
         self.logger.debug("Making request IPC. Path: %s, Method: %s",
                           self.ipc_path, method)
         request = self.encode_rpc_request(method, params)
+        return self._send_request(request)
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request IPC. Path: %s, Methods: %s",
+                          self.ipc_path, [method for method, _ in requests])
+        request, request_ids = self.encode_batch_rpc_request(requests)
+        return match_batch_responses(self._send_request(request), request_ids)
 
+    def _send_request(self, request: bytes) -> Any:
         with self._lock, self._socket as sock:
             try:
                 sock.sendall(request)
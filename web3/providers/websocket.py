@@ -10,7 +10,10 @@ from types import (
 )
 from typing import (
     Any,
+    List,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     Union,
 )
@@ -25,6 +28,9 @@ from websockets.legacy.client import (
     WebSocketClientProtocol,
 )
 
+from web3._utils.batching import (
+    match_batch_responses,
+)
 from web3.exceptions import (
     ValidationError,
 )
@@ -142,3 +148,15 @@ class WebsocketProvider(JSONBaseProvider):
             WebsocketProvider._loop
         )
         return future.result()
+
+    def make_batch_request(
+        self, requests: Sequence[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        self.logger.debug("Making batch request WebSocket. URI: %s, "
+                          "Methods: %s", self.endpoint_uri, [method for method, _ in requests])
+        request_data, request_ids = self.encode_batch_rpc_request(requests)
+        future = asyncio.run_coroutine_threadsafe(
+            self.coro_make_request(request_data),
+            WebsocketProvider._loop
+        )
+        return match_batch_responses(future.result(), request_ids)
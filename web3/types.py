@@ -4,6 +4,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    NamedTuple,
     NewType,
     Optional,
     Sequence,
@@ -389,6 +390,12 @@ class TxPoolStatus(TypedDict, total=False):
     queued: int
 
 
+class TxPoolSnapshot(NamedTuple):
+    content: TxPoolContent
+    inspect: TxPoolInspect
+    status: TxPoolStatus
+
+
 #
 # web3.geth types
 #